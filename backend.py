@@ -1,109 +1,324 @@
 import json
+import os
+import queue
 import sqlite3
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import orjson
+except ImportError:  # orjson nahi mila to stdlib json se kaam chalao
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick optional hai, warna plain "in" checks
+    ahocorasick = None
+
+
+def json_dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def json_loads(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def valid_otp(otp):
+    # Demo logic: koi bhi 6-digit OTP ko valid maan lo
+    return type(otp) is str and len(otp) == 6 and otp.isascii() and otp.isdigit()
+
+
+def valid_phone(phone):
+    # Format pe koi rok nahi (purane users "98765-43210" jaise bhi hain),
+    # bas khali na ho aur kahin bhi whitespace na ho
+    return type(phone) is str and phone.split() == [phone]
+
 
 DB_PATH = "nightcare.db"
 
+# Har naye connection pe ek hi baar lagte hain (per request nahi)
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+PRAGMA mmap_size = 268435456;
+"""
+
+# Request path ke SQL ek jagah constants me, taaki pooled connection ka
+# statement cache hit ho aur har baar prepare na karna pade
+
+# Naya user ho ya purana, ek hi statement me row wapas mil jaati hai
+# (RETURNING ke liye SQLite >= 3.35 chahiye)
+SQL_UPSERT_USER = """
+INSERT INTO users(phone) VALUES (?)
+ON CONFLICT(phone) DO UPDATE SET phone = excluded.phone
+RETURNING id, phone, created_at
+"""
+
+SQL_INSERT_BOOKING = """
+INSERT INTO ambulance_bookings(user_phone, pickup_location, destination, status)
+VALUES (?, ?, ?, ?)
+"""
+SQL_SELECT_BLOOD_BY_GROUP = """
+SELECT name, units_available, distance_km
+FROM blood_banks
+WHERE blood_group = ?
+ORDER BY distance_km ASC
+"""
+SQL_SELECT_DOCTORS = (
+    "SELECT id, name, speciality, rating, distance_km FROM doctors ORDER BY distance_km ASC"
+)
+
 
 def get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.executescript(CONNECTION_PRAGMAS)
     return conn
 
 
+class ConnectionPool:
+    """
+    Har request pe naya connection kholne ke bajaye
+    yahi se ready connections uthao aur wapas rakh do.
+    """
+
+    def __init__(self, size=None):
+        self.size = size or os.cpu_count() or 4
+        self._conns = queue.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            self._conns.put(get_db_connection())
+
+    def acquire(self):
+        return self._conns.get()
+
+    def release(self, conn):
+        self._conns.put(conn)
+
+    @contextmanager
+    def get(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            # Handler beech me fail hua to adhuri transaction agle
+            # borrower tak na pahunche; rollback fail ho tab bhi
+            # connection pool me wapas jaana chahiye
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            finally:
+                self.release(conn)
+
+
+# Saara schema + dummy seed data ek hi script me.
+# Seed rows unique index ki wajah se dobara insert nahi hote, isliye
+# COUNT(*) check ki zarurat nahi. (UNIQUE index alag se isliye hai taaki
+# purani nightcare.db files pe bhi lage, CREATE TABLE IF NOT EXISTS
+# existing table ko nahi badalta.)
+SCHEMA_AND_SEED_SQL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    phone TEXT UNIQUE NOT NULL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS doctors (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    speciality TEXT NOT NULL,
+    rating REAL,
+    distance_km REAL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_doctors_name_speciality
+    ON doctors(name, speciality);
+CREATE INDEX IF NOT EXISTS idx_doctors_dist
+    ON doctors(distance_km);
+
+CREATE TABLE IF NOT EXISTS ambulance_bookings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_phone TEXT,
+    pickup_location TEXT,
+    destination TEXT,
+    status TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS blood_banks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    blood_group TEXT NOT NULL,
+    units_available INTEGER NOT NULL,
+    distance_km REAL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_blood_banks_name_group
+    ON blood_banks(name, blood_group);
+-- Covering index: blood check query table ko chhuye bina isi se chal jaati hai
+CREATE INDEX IF NOT EXISTS idx_blood_group_dist
+    ON blood_banks(blood_group, distance_km, name, units_available);
+
+INSERT OR IGNORE INTO doctors(name, speciality, rating, distance_km) VALUES
+    ('Dr. Aditi Rao', 'emergency', 4.9, 1.2),
+    ('Dr. Karan Mehta', 'cardio', 4.8, 2.1),
+    ('Dr. Sana Ali', 'pediatrics', 4.7, 0.9);
+
+INSERT OR IGNORE INTO blood_banks(name, blood_group, units_available, distance_km) VALUES
+    ('City Blood Center', 'A+', 6, 2.1),
+    ('City Blood Center', 'O+', 4, 2.1),
+    ('Metro Blood Bank', 'A+', 3, 3.4),
+    ('Metro Blood Bank', 'O+', 2, 3.4),
+    ('Govt. Blood Bank', 'A+', 0, 4.1);
+
+COMMIT;
+"""
+
+
 def init_db():
     """
     Yahi pe saare tables ban rahe hain.
     Alag schema.sql ki zarurat nahi.
     """
     conn = get_db_connection()
-    cur = conn.cursor()
-
-    # Users table
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            phone TEXT UNIQUE NOT NULL,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-        """
-    )
+    conn.executescript(SCHEMA_AND_SEED_SQL)
+    conn.close()
 
-    # Doctors
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS doctors (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            speciality TEXT NOT NULL,
-            rating REAL,
-            distance_km REAL
-        )
-        """
-    )
 
-    # Ambulance bookings
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS ambulance_bookings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_phone TEXT,
-            pickup_location TEXT,
-            destination TEXT,
-            status TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-        """
+# Symptom keywords, priority order me (pehla match sabse serious)
+SYMPTOM_KEYWORDS = [
+    ("critical", ("chest", "stroke", "unconscious")),
+    ("breathing", ("breath", "asthma")),
+    ("bleeding", ("bleeding", "blood")),
+    ("fever", ("fever", "temperature")),
+]
+
+# category -> fixed response; JSON bytes import pe hi ek baar ban jaate hain
+SYMPTOM_RESULTS = {
+    "critical": {
+        "possible_problem": "Possible cardiac / neurological emergency",
+        "severity": "critical",
+        "urgency": "emergency",
+        "recommendation": (
+            "Immediate ambulance required. Do NOT drive yourself. "
+            "Start CPR if not breathing."
+        ),
+    },
+    "breathing": {
+        "possible_problem": "Breathing difficulty / possible asthma or lung issue",
+        "severity": "high",
+        "urgency": "urgent",
+        "recommendation": (
+            "Use inhaler if prescribed & seek emergency department or "
+            "ambulance if worsening."
+        ),
+    },
+    "bleeding": {
+        "possible_problem": "Significant bleeding",
+        "severity": "high",
+        "urgency": "urgent",
+        "recommendation": "Apply firm pressure, keep limb elevated & visit nearest emergency within 30 minutes.",
+    },
+    "fever": {
+        "possible_problem": "Fever / infection-like symptoms",
+        "severity": "moderate",
+        "urgency": "normal",
+        "recommendation": (
+            "Hydrate, use paracetamol as advised & book online doctor if "
+            "more than 48h or very high fever."
+        ),
+    },
+    "mild": {
+        "possible_problem": "General viral / mild condition",
+        "severity": "mild",
+        "urgency": "normal",
+        "recommendation": "Monitor at home, hydrate well & consult online if symptoms persist.",
+    },
+}
+
+SYMPTOM_RESPONSES = {
+    category: json_dumps(result) for category, result in SYMPTOM_RESULTS.items()
+}
+
+
+def build_symptom_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (category, keywords) in enumerate(SYMPTOM_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword, (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+
+SYMPTOM_AUTOMATON = build_symptom_automaton()
+
+
+def classify_symptoms(text):
+    """
+    Text ko ek hi pass me scan karke sabse serious category lautao.
+    """
+    if SYMPTOM_AUTOMATON is not None:
+        best = None
+        for _, hit in SYMPTOM_AUTOMATON.iter(text):
+            if best is None or hit < best:
+                best = hit
+                if hit[0] == 0:
+                    break
+        return best[1] if best else "mild"
+
+    for category, keywords in SYMPTOM_KEYWORDS:
+        if any(k in text for k in keywords):
+            return category
+    return "mild"
+
+
+# Fixed CORS headers, ek hi baar bytes me bana ke rakhe hain
+_CORS_BYTES = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+)
+
+
+# Login/ambulance ke fixed-shape success responses: id/row ko dict
+# banaye bina seedhe JSON bytes me bharo.
+def login_ok_json(row):
+    user_id, phone, created_at = row
+    return b'{"status":"ok","user":{"id":%d,"phone":%b,"created_at":%b}}' % (
+        user_id,
+        json_dumps(phone),
+        json_dumps(created_at),
     )
 
-    # Blood banks
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS blood_banks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            blood_group TEXT NOT NULL,
-            units_available INTEGER NOT NULL,
-            distance_km REAL
-        )
-        """
+
+def ambulance_ok_json(booking_id):
+    return (
+        b'{"status":"ok","booking_id":%d,"eta_minutes":5,'
+        b'"message":"Ambulance booked, driver will contact you shortly."}'
+        % booking_id
     )
 
-    # Seed doctors (dummy data)
-    cur.execute("SELECT COUNT(*) AS c FROM doctors")
-    if cur.fetchone()["c"] == 0:
-        doctors = [
-            ("Dr. Aditi Rao", "emergency", 4.9, 1.2),
-            ("Dr. Karan Mehta", "cardio", 4.8, 2.1),
-            ("Dr. Sana Ali", "pediatrics", 4.7, 0.9),
-        ]
-        cur.executemany(
-            "INSERT INTO doctors(name, speciality, rating, distance_km) VALUES (?,?,?,?)",
-            doctors,
-        )
 
-    # Seed blood banks (dummy data)
-    cur.execute("SELECT COUNT(*) AS c FROM blood_banks")
-    if cur.fetchone()["c"] == 0:
-        blood_rows = [
-            ("City Blood Center", "A+", 6, 2.1),
-            ("City Blood Center", "O+", 4, 2.1),
-            ("Metro Blood Bank", "A+", 3, 3.4),
-            ("Metro Blood Bank", "O+", 2, 3.4),
-            ("Govt. Blood Bank", "A+", 0, 4.1),
-        ]
-        cur.executemany(
-            "INSERT INTO blood_banks(name, blood_group, units_available, distance_km) VALUES (?,?,?,?)",
-            blood_rows,
-        )
-
-    conn.commit()
-    conn.close()
+class ApiHandler(BaseHTTPRequestHandler):
+    # Doctors seed ke baad badalte nahi, isliye serialized JSON yahi rakh lo.
+    # Koi doctor add/update karne wala handler aaye to ise None kar dena.
+    _doctors_cache = None
+    _doctors_lock = threading.Lock()
 
+    # Keep-alive: ek TCP connection (aur ek thread) pe kai requests.
+    # Har response me Content-Length hona zaroori hai, aur idle
+    # connection timeout ke baad band ho jaata hai.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
 
-class ApiHandler(BaseHTTPRequestHandler):
     # ---------- Helper methods ----------
 
     def _set_cors_headers(self):
@@ -112,27 +327,70 @@ class ApiHandler(BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
 
     def send_json(self, data, status=200):
-        response = json.dumps(data).encode("utf-8")
-        self.send_response(status)
-        self._set_cors_headers()
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response)))
-        self.end_headers()
-        self.wfile.write(response)
+        self.send_json_bytes(json_dumps(data), status)
+
+    def send_json_bytes(self, response, status=200):
+        self.log_request(status)
+        # send_header() ke chakkar me na pado, headers + body ek syscall me bhejo
+        prologue = (
+            b"%s %d %s\r\n"
+            % (
+                self.protocol_version.encode("latin-1"),
+                status,
+                self.responses[status][0].encode("latin-1"),
+            )
+            + _CORS_BYTES
+            + (b"Connection: close\r\n" if self.close_connection else b"")
+            + b"Content-Type: application/json\r\nContent-Length: %d\r\n\r\n"
+            % len(response)
+        )
+
+        sendmsg = getattr(self.connection, "sendmsg", None)
+        if sendmsg is None:  # Windows pe sendmsg nahi hota
+            self.wfile.write(prologue + response)
+            return
+
+        self.wfile.flush()
+        sent = sendmsg([prologue, response])
+        if sent < len(prologue) + len(response):
+            # Partial send: baaki bytes normal tarike se bhej do
+            self.connection.sendall((prologue + response)[sent:])
+
+    def body_announced(self):
+        return "Transfer-Encoding" in self.headers or self.headers.get(
+            "Content-Length", "0"
+        ).strip() not in ("", "0")
+
+    def read_body(self):
+        # Keep-alive pe jo body padhi nahi gayi wo agli request ban jaati hai,
+        # isliye chunked / ajeeb Content-Length pe connection band kar do
+        if "Transfer-Encoding" in self.headers:
+            self.close_connection = True
+            return b""
 
-    def read_json_body(self):
         length_str = self.headers.get("Content-Length", "0")
         try:
             length = int(length_str)
         except ValueError:
-            length = 0
+            self.close_connection = True
+            return b""
 
+        if length < 0:
+            self.close_connection = True
+            return b""
         if length == 0:
+            return b""
+        # Raw bytes hi lautao: orjson aur stdlib json dono bytes seedha
+        # parse kar lete hain, alag se decode("utf-8") ki zarurat nahi
+        return self.rfile.read(length)
+
+    def read_json_body(self):
+        body = self.read_body()
+        if not body:
             return {}
-        body = self.rfile.read(length).decode("utf-8")
         try:
-            return json.loads(body)
-        except json.JSONDecodeError:
+            return json_loads(body)
+        except ValueError:
             return {}
 
     # ---------- CORS preflight ----------
@@ -140,65 +398,60 @@ class ApiHandler(BaseHTTPRequestHandler):
     def do_OPTIONS(self):
         self.send_response(200)
         self._set_cors_headers()
+        self.send_header("Content-Length", "0")
+        if self.body_announced():
+            self.send_header("Connection", "close")
         self.end_headers()
 
     # ---------- Routing ----------
 
     def do_POST(self):
-        path = urlparse(self.path).path
-
-        if path == "/api/login":
-            self.handle_login()
-        elif path == "/api/symptom-checker":
-            self.handle_symptom_checker()
-        elif path == "/api/ambulance/book":
-            self.handle_ambulance_book()
-        elif path == "/api/blood/check":
-            self.handle_blood_check()
-        else:
+        path = self.path.partition("?")[0]
+        handler = self._POST_ROUTES.get(path)
+        if handler is None:
+            # Body padhenge nahi, to connection bhi reuse nahi karna
+            self.close_connection = True
             self.send_json({"error": "Not found"}, status=404)
+            return
+        handler(self)
 
     def do_GET(self):
-        path = urlparse(self.path).path
-
-        if path == "/api/doctors":
-            self.handle_doctors()
-        else:
+        if self.body_announced():
+            self.close_connection = True
+        path = self.path.partition("?")[0]
+        handler = self._GET_ROUTES.get(path)
+        if handler is None:
             self.send_json({"error": "Not found"}, status=404)
+            return
+        handler(self)
 
     # ---------- Handlers ----------
 
     def handle_login(self):
         data = self.read_json_body()
-        phone = (data.get("phone") or "").strip()
-        otp = (data.get("otp") or "").strip()
+        phone = data.get("phone")
+        otp = data.get("otp")
 
         if not phone or not otp:
             self.send_json({"error": "phone and otp required"}, status=400)
             return
 
-        # Demo logic: koi bhi 6-digit OTP ko valid maan lo
-        if len(otp) != 6:
+        if not valid_otp(otp):
             self.send_json({"error": "invalid otp, must be 6 digits"}, status=400)
             return
 
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT OR IGNORE INTO users(phone) VALUES (?)",
-            (phone,),
-        )
-        conn.commit()
-        cur.execute("SELECT id, phone, created_at FROM users WHERE phone = ?", (phone,))
-        row = cur.fetchone()
-        conn.close()
+        if not valid_phone(phone):
+            self.send_json({"error": "invalid phone number"}, status=400)
+            return
+
+        with self.server.pool.get() as conn, conn:
+            row = conn.execute(SQL_UPSERT_USER, (phone,)).fetchone()
 
         if row is None:
             self.send_json({"error": "could not create user"}, status=500)
             return
 
-        user = dict(row)
-        self.send_json({"status": "ok", "user": user})
+        self.send_json_bytes(login_ok_json(row))
 
     def handle_symptom_checker(self):
         data = self.read_json_body()
@@ -214,64 +467,33 @@ class ApiHandler(BaseHTTPRequestHandler):
             )
             return
 
-        severity = "mild"
-        urgency = "normal"
-        problem = "General viral / mild condition"
-        recommendation = (
-            "Monitor at home, hydrate well & consult online if symptoms persist."
-        )
-
-        if any(k in text for k in ["chest", "stroke", "unconscious"]):
-            severity = "critical"
-            urgency = "emergency"
-            problem = "Possible cardiac / neurological emergency"
-            recommendation = (
-                "Immediate ambulance required. Do NOT drive yourself. "
-                "Start CPR if not breathing."
-            )
-        elif "breath" in text or "difficulty breathing" in text or "asthma" in text:
-            severity = "high"
-            urgency = "urgent"
-            problem = "Breathing difficulty / possible asthma or lung issue"
-            recommendation = (
-                "Use inhaler if prescribed & seek emergency department or "
-                "ambulance if worsening."
-            )
-        elif "bleeding" in text or "blood" in text:
-            severity = "high"
-            urgency = "urgent"
-            problem = "Significant bleeding"
-            recommendation = (
-                "Apply firm pressure, keep limb elevated & visit nearest emergency within 30 minutes."
-            )
-        elif "fever" in text or "temperature" in text:
-            severity = "moderate"
-            urgency = "normal"
-            problem = "Fever / infection-like symptoms"
-            recommendation = (
-                "Hydrate, use paracetamol as advised & book online doctor if "
-                "more than 48h or very high fever."
-            )
-
-        self.send_json(
-            {
-                "possible_problem": problem,
-                "severity": severity,
-                "urgency": urgency,
-                "recommendation": recommendation,
-            }
-        )
+        self.send_json_bytes(SYMPTOM_RESPONSES[classify_symptoms(text)])
 
     def handle_doctors(self):
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT id, name, speciality, rating, distance_km FROM doctors ORDER BY distance_km ASC"
-        )
-        rows = cur.fetchall()
-        conn.close()
-        doctors = [dict(r) for r in rows]
-        self.send_json({"doctors": doctors})
+        cached = ApiHandler._doctors_cache
+        if cached is None:
+            cached = self.load_doctors_cache()
+        self.send_json_bytes(cached)
+
+    def load_doctors_cache(self):
+        with ApiHandler._doctors_lock:
+            if ApiHandler._doctors_cache is None:
+                with self.server.pool.get() as conn:
+                    cur = conn.cursor()
+                    cur.execute(SQL_SELECT_DOCTORS)
+                    rows = cur.fetchall()
+                doctors = [
+                    {
+                        "id": doctor_id,
+                        "name": name,
+                        "speciality": speciality,
+                        "rating": rating,
+                        "distance_km": distance_km,
+                    }
+                    for doctor_id, name, speciality, rating, distance_km in rows
+                ]
+                ApiHandler._doctors_cache = json_dumps({"doctors": doctors})
+            return ApiHandler._doctors_cache
 
     def handle_ambulance_book(self):
         data = self.read_json_body()
@@ -283,27 +505,12 @@ class ApiHandler(BaseHTTPRequestHandler):
             self.send_json({"error": "pickup_location required"}, status=400)
             return
 
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO ambulance_bookings(user_phone, pickup_location, destination, status)
-            VALUES (?, ?, ?, ?)
-            """,
-            (phone, pickup, dest, "BOOKED"),
-        )
-        booking_id = cur.lastrowid
-        conn.commit()
-        conn.close()
-
-        self.send_json(
-            {
-                "status": "ok",
-                "booking_id": booking_id,
-                "eta_minutes": 5,
-                "message": "Ambulance booked, driver will contact you shortly.",
-            }
-        )
+        with self.server.pool.get() as conn, conn:
+            booking_id = conn.execute(
+                SQL_INSERT_BOOKING, (phone, pickup, dest, "BOOKED")
+            ).lastrowid
+
+        self.send_json_bytes(ambulance_ok_json(booking_id))
 
     def handle_blood_check(self):
         data = self.read_json_body()
@@ -313,28 +520,43 @@ class ApiHandler(BaseHTTPRequestHandler):
             self.send_json({"error": "blood_group required"}, status=400)
             return
 
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT name, units_available, distance_km
-            FROM blood_banks
-            WHERE blood_group = ?
-            ORDER BY distance_km ASC
-            """,
-            (group,),
-        )
-        rows = cur.fetchall()
-        conn.close()
+        with self.server.pool.get() as conn:
+            cur = conn.cursor()
+            cur.execute(SQL_SELECT_BLOOD_BY_GROUP, (group,))
+            rows = cur.fetchall()
 
-        banks = [dict(r) for r in rows]
+        banks = [
+            {"name": name, "units_available": units, "distance_km": distance_km}
+            for name, units, distance_km in rows
+        ]
         self.send_json({"blood_group": group, "banks": banks})
 
+    # ---------- Route tables ----------
+
+    _POST_ROUTES = {
+        "/api/login": handle_login,
+        "/api/symptom-checker": handle_symptom_checker,
+        "/api/ambulance/book": handle_ambulance_book,
+        "/api/blood/check": handle_blood_check,
+    }
+
+    _GET_ROUTES = {
+        "/api/doctors": handle_doctors,
+    }
+
+
+class ApiServer(ThreadingHTTPServer):
+    # Har request apne thread pe; DB access pool ke through hota hai
+    daemon_threads = True
+    request_queue_size = 128
+
 
 def run_server(port=8000):
     init_db()
     server_address = ("", port)
-    httpd = HTTPServer(server_address, ApiHandler)
+    httpd = ApiServer(server_address, ApiHandler)
+    # init_db() ke baad hi pool warm karo, taaki tables pehle se bane hon
+    httpd.pool = ConnectionPool()
     print(f"Backend running on http://localhost:{port}")
     httpd.serve_forever()
 